@@ -4,15 +4,19 @@
 Xcode Project (or general directory) to PDF report.
 Strips accents/■ to ASCII, uses Courier, and emits raw code.
 Allows customization of ignored items, file type definitions, and content length limits.
-Auto-installs ReportLab/Pillow if needed (can be disabled).
+Auto-installs ReportLab if needed (can be disabled).
 """
 import os
+import re
 import sys
 import subprocess
 import argparse
 import mimetypes
 import datetime
+import textwrap
 import unicodedata
+import concurrent.futures
+import collections
 
 # Default Configurations (can be overridden by command-line arguments)
 DEFAULT_IGNORE_DIRS  = {'.git','Pods','build','.swiftpm','DerivedData','.xcodeproj',
@@ -24,8 +28,11 @@ DEFAULT_DATA_EXT     = {'.plist','.json','.xml','.yaml','.yml','.storyboard',
                         '.xib','.entitlements','.xcscheme','.md','.txt','.rtf'}
 DEFAULT_MAX_CODE_LEN = -1  # -1 for unlimited
 DEFAULT_MAX_DATA_LEN = 15000 # Truncate large data files by default
+TREE_INDENTS = tuple('  ' * depth for depth in range(64)) # Tree indentation by depth; deeper levels fall back to multiplication
+SUMMARY_ROWS_PER_TABLE = 200 # Files per summary Table; keeps ReportLab's table layout cost roughly linear
+TEXT_CACHE_CHARS = 8_000_000 # Sanitized text kept from the summary pass for reuse in the contents pass
 
-# ReportLab and Pillow will be imported after potential installation
+# ReportLab will be imported after potential installation
 reportlab_pagesizes = None
 reportlab_platypus = None
 reportlab_styles = None
@@ -33,23 +40,31 @@ reportlab_enums = None
 reportlab_colors = None
 MONO_FONT = 'Courier' # Default monospace font for ReportLab
 
+# Every style the report uses, built once by build_report_styles() after ReportLab is imported
+ReportStyles = collections.namedtuple('ReportStyles', 'heading1 heading2 meta_info tree content summary_table')
+_STYLES = None
+
 # ─── SANITIZE (strip accents and ■) ───────────────────────────────────────────
+_BOX_TABLE = str.maketrans({'■': '_'}) # Replace special box character
+_STRIP_NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+
 def sanitize(text: str) -> str:
     """Converts text to basic ASCII, replacing ■ with _."""
-    text = text.replace('■', '_') # Replace special box character
-    nfkd_form = unicodedata.normalize('NFKD', text)
-    return nfkd_form.encode('ASCII', 'ignore').decode('ASCII')
+    text = text.translate(_BOX_TABLE)
+    if text.isascii(): # Common case for source code: nothing to normalize or strip
+        return text
+    # Quick-check first: text that is already in NFKD form skips the decomposition copy
+    nfkd_form = text if unicodedata.is_normalized('NFKD', text) else unicodedata.normalize('NFKD', text)
+    return _STRIP_NON_ASCII.sub('', nfkd_form) # Drops combining marks and anything else outside ASCII
 
 # ─── HELPERS ────────────────────────────────────────────────────────────────
-def classify_file(path, code_extensions_set):
-    """Classifies a file as 'code' or 'data' based on its extension."""
-    _, ext = os.path.splitext(path)
-    return 'code' if ext.lower() in code_extensions_set else 'data'
+def classify_file(name_lower, code_ext_tuple):
+    """Classifies a file as 'code' or 'data' based on its lowercased file name."""
+    return 'code' if name_lower.endswith(code_ext_tuple) else 'data'
 
-def is_text_file(path, code_extensions_set, data_extensions_set):
+def is_text_file(path, name_lower, code_ext_tuple, data_ext_tuple):
     """Determines if a file is likely a text file based on extension or MIME type."""
-    _, ext = os.path.splitext(path)
-    if ext.lower() in code_extensions_set or ext.lower() in data_extensions_set:
+    if name_lower.endswith(code_ext_tuple) or name_lower.endswith(data_ext_tuple):
         return True
     
     # Fallback to MIME type guessing for other extensions
@@ -59,53 +74,101 @@ def is_text_file(path, code_extensions_set, data_extensions_set):
                mime_type in ('application/xml', 'application/json', 'application/javascript')
     return False # Default to non-text if unsure
 
-def get_directory_tree(root_path, ignore_dirs_set, ignore_files_set):
-    """Generates a string representation of the directory tree."""
-    lines = []
-    sanitized_root_basename = sanitize(os.path.basename(os.path.abspath(root_path)))
-    lines.append(f"{sanitized_root_basename}/")
-
-    for dirpath, dirnames, filenames in os.walk(root_path, topdown=True):
-        # Filter ignored directories in-place to prevent os.walk from descending into them
-        dirnames[:] = [d for d in dirnames if d not in ignore_dirs_set and not d.startswith('.')]
-        
-        relative_dir_path = os.path.relpath(dirpath, root_path)
-        level = 0 if relative_dir_path == '.' else relative_dir_path.count(os.sep) + 1
-        
-        indent = '  ' * level
-        if relative_dir_path != '.': # Add directory entry if not the root itself
-            lines.append(f"{indent[:-2]}{sanitize(os.path.basename(dirpath))}/") # Correct indent for dir
-
+def _keep(name, ignore_set):
+    """True for names that are neither hidden (dot-prefixed) nor listed in ignore_set."""
+    return name[:1] != '.' and name not in ignore_set
+
+def iter_files(root_path, ignore_dirs_set, ignore_files_set):
+    """
+    Walks root_path depth-first and yields (name, full_path, relative_path, depth, is_dir) for every
+    non-ignored directory and file below it; depth counts the directories between root_path and the entry.
+    Uses os.scandir so directory checks come from the cached DirEntry instead of an extra stat() per entry.
+    Each directory is yielded before its files, which come (sorted) before its subdirectories,
+    matching os.walk's top-down order.
+    """
+    keep = _keep # Local alias: called once per directory entry
+    stack = [(None, root_path, '', 0)] # (name, path, relative path prefix, depth of its contents)
+    while stack:
+        dir_name, dir_path, relative_dir, depth = stack.pop()
+        subdirs = []
+        filenames = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if entry.is_dir():
+                        # Like os.walk, never descend into symlinked directories
+                        if keep(name, ignore_dirs_set) and not entry.is_symlink():
+                            subdirs.append(name)
+                    elif keep(name, ignore_files_set):
+                        filenames.append(name)
+        except OSError:
+            continue # Unreadable directory; os.walk silently skipped these too
+
+        if dir_name is not None: # The root itself is not reported
+            yield dir_name, dir_path, relative_dir, depth - 1, True
         for filename in sorted(filenames):
-            if filename in ignore_files_set or filename.startswith('.'):
-                continue
-            lines.append(f"{indent}{sanitize(filename)}")
-            
-    return "\n".join(lines)
-
-def get_file_content_and_status(path, max_code_len, max_data_len, code_ext_set, data_ext_set):
-    """Reads file content, sanitizes it, and provides status info (full, partial, non-text, error)."""
-    info = {'status': 'Unknown', 'extracted_chars': None, 'total_chars': None, 'error_message': None}
+            yield filename, os.path.join(dir_path, filename), relative_dir + filename, depth, False
+        # Push in reverse so the alphabetically first subdirectory is popped next
+        for name in sorted(subdirs, reverse=True):
+            stack.append((name, os.path.join(dir_path, name), relative_dir + name + os.sep, depth + 1))
+
+def classify_file_status(path, max_code_len, max_data_len, code_ext_tuple, data_ext_tuple):
+    """
+    Decides how a file will be reported without opening it.
+    Returns (info, limit): info['status'] is 'Non-Text' for files that are never read (limit is None),
+    otherwise 'Unknown' until read_text_file() fills it in; limit is the character cap (-1 for unlimited).
+    code_ext_tuple/data_ext_tuple are lowercased suffixes matched with str.endswith.
+    """
+    info = {'status': 'Unknown', 'extracted_chars': None, 'total_chars': None, 'total_bytes': None, 'error_message': None}
     filename = os.path.basename(path)
+    name_lower = filename.lower() # Computed once and shared by both classification checks
 
-    try:
-        if not is_text_file(path, code_ext_set, data_ext_set):
-            info['status'] = 'Non-Text'
-            return "[Non-text file; content not displayed]", info
+    if not is_text_file(path, name_lower, code_ext_tuple, data_ext_tuple):
+        info['status'] = 'Non-Text'
+        return info, None
 
-        file_type = classify_file(path, code_ext_set)
+    file_type = classify_file(name_lower, code_ext_tuple)
+    limit = -1
+    if filename == 'project.pbxproj': # Always try to get full pbxproj
         limit = -1
-        if filename == 'project.pbxproj': # Always try to get full pbxproj
-            limit = -1
-        elif file_type == 'code':
-            limit = max_code_len
-        else: # data or other text files
-            limit = max_data_len
-        
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Replace tabs with 4 spaces for consistent formatting in PDF
-            text_content = f.read().replace('\t', '    ') 
-        
+    elif file_type == 'code':
+        limit = max_code_len
+    else: # data or other text files
+        limit = max_data_len
+    return info, limit
+
+def _decode_text(raw):
+    """Decodes UTF-8 bytes (dropping invalid sequences), normalizes newlines as text mode would, and expands tabs to 4-column stops."""
+    text = raw.decode('utf-8', 'ignore')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    # Column-aware tab expansion keeps tab-aligned code lined up in the PDF's monospace font
+    return text.expandtabs(4) if '\t' in text else text
+
+def read_text_file(path, limit, info):
+    """Reads and sanitizes a text file up to limit characters, recording status (full, partial, error) in info. Returns the text to display."""
+    try:
+        if limit != -1:
+            # UTF-8 needs at most 4 bytes per character; the slack covers a character split at the boundary
+            prefix_bytes = limit * 4 + 64
+            file_size = os.path.getsize(path)
+            if file_size > prefix_bytes:
+                # Read and decode only the prefix that can survive truncation; the tail is never touched
+                with open(path, 'rb') as f:
+                    text_prefix = _decode_text(f.read(prefix_bytes))
+                sanitized_prefix = sanitize(text_prefix)
+                if len(sanitized_prefix) > limit:
+                    snippet = sanitized_prefix[:limit]
+                    # Only the prefix was decoded, so the total size is reported in bytes
+                    info.update(status='Partial', extracted_chars=len(snippet), total_bytes=file_size)
+                    return snippet + f"\n\n[Content truncated at {info['extracted_chars']} characters]"
+                # Sanitizing stripped too much of the prefix (e.g. emoji-heavy text); fall back to a full read
+
+        # Binary read plus one decode of the whole buffer; avoids text mode's incremental decoder
+        with open(path, 'rb') as f:
+            text_content = _decode_text(f.read())
+
         sanitized_content = sanitize(text_content)
         total_chars = len(sanitized_content)
         info['total_chars'] = total_chars
@@ -113,142 +176,240 @@ def get_file_content_and_status(path, max_code_len, max_data_len, code_ext_set,
         if limit != -1 and total_chars > limit:
             snippet = sanitized_content[:limit]
             info.update(status='Partial', extracted_chars=len(snippet))
-            return snippet + f"\n\n[Content truncated at {info['extracted_chars']} characters]", info
+            return snippet + f"\n\n[Content truncated at {info['extracted_chars']} characters]"
         
         info.update(status='Full', extracted_chars=total_chars)
-        return sanitized_content, info
+        return sanitized_content
 
     except Exception as e:
         info.update(status='Error', error_message=str(e))
-        return f"[Error reading file {filename}: {e}]", info
+        return f"[Error reading file {os.path.basename(path)}: {e}]"
+
+def build_report_styles():
+    """Creates the paragraph and table styles once; call after ReportLab has been imported."""
+    sample_styles = reportlab_styles.getSampleStyleSheet()
+    return ReportStyles(
+        heading1=sample_styles['Heading1'],
+        heading2=sample_styles['Heading2'],
+        meta_info=reportlab_styles.ParagraphStyle('MetaInfo', fontSize=9, textColor=reportlab_colors.darkgrey, spaceBefore=6),
+        tree=reportlab_styles.ParagraphStyle('DirectoryTree', fontName=MONO_FONT, fontSize=9, leading=11),
+        content=reportlab_styles.ParagraphStyle('FileContent', fontName=MONO_FONT, fontSize=8.5, leading=10),
+        # Base commands shared by every summary table; per-row colours are appended per table
+        summary_table=(
+            ('BACKGROUND', (0, 0), (-1, 0), reportlab_colors.grey),    # Header background
+            ('TEXTCOLOR', (0, 0), (-1, 0), reportlab_colors.whitesmoke), # Header text
+            ('GRID', (0, 0), (-1, -1), 1, reportlab_colors.black),       # Grid for all cells
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),                     # Vertical alignment
+            ('FONTSIZE', (0, 1), (-1, -1), 8),                          # Body rows
+            ('LEADING', (0, 1), (-1, -1), 9),
+            ('FONTNAME', (0, 1), (0, -1), MONO_FONT),                   # Paths in monospace
+            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),                      # Status and details centered
+        ),
+    )
+
+def _wrap_cell(text, width):
+    """Breaks text into lines of at most width characters; Table draws '\n' in plain string cells as line breaks."""
+    return text if len(text) <= width else textwrap.fill(text, width)
 
 def generate_summary_table(summary_data):
-    """Generates a ReportLab Table for the file extraction summary."""
-    global reportlab_platypus, reportlab_styles, reportlab_colors # Use globally imported modules
+    """
+    Generates the ReportLab Tables for the file extraction summary, one per SUMMARY_ROWS_PER_TABLE files.
+    ReportLab's table layout cost grows much faster than linearly with row count, so several small
+    tables (with fixed column widths) lay out far quicker than one huge one.
+    Cells are plain strings styled through TableStyle commands; wrapping every cell in a Paragraph
+    (which parses its text as markup) dominated layout time on large projects.
+    """
+    global reportlab_platypus, reportlab_colors # Use globally imported modules
 
     header = ['File Path', 'Status', 'Details']
-    table_data = [header]
-
-    # Define paragraph styles for table cells
-    path_style = reportlab_styles.ParagraphStyle('PathStyle', fontName=MONO_FONT, fontSize=8, leading=9, alignment=reportlab_enums.TA_LEFT)
-    status_style_normal = reportlab_styles.ParagraphStyle('StatusStyleNormal', fontSize=8, leading=9, alignment=reportlab_enums.TA_CENTER)
-    status_style_partial = reportlab_styles.ParagraphStyle('StatusStylePartial', fontSize=8, leading=9, alignment=reportlab_enums.TA_CENTER, textColor=reportlab_colors.red)
-    status_style_error = reportlab_styles.ParagraphStyle('StatusStyleError', fontSize=8, leading=9, alignment=reportlab_enums.TA_CENTER, textColor=reportlab_colors.darkred)
-    details_style = reportlab_styles.ParagraphStyle('DetailsStyle', fontSize=8, leading=9, alignment=reportlab_enums.TA_CENTER)
-
-    table_style_commands = [
-        ('BACKGROUND', (0, 0), (-1, 0), reportlab_colors.grey),    # Header background
-        ('TEXTCOLOR', (0, 0), (-1, 0), reportlab_colors.whitesmoke), # Header text
-        ('GRID', (0, 0), (-1, -1), 1, reportlab_colors.black),       # Grid for all cells
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),                     # Vertical alignment
-    ]
 
-    for i, item_info in enumerate(sorted(summary_data, key=lambda x: x['relative_path']), start=1):
+    rows = [] # (cells, status text colour, row background)
+    for item_info in sorted(summary_data, key=lambda x: x['relative_path']):
         status = item_info['status']
-        relative_path_sanitized = sanitize(item_info['relative_path'])
-        
-        path_paragraph = reportlab_platypus.Paragraph(relative_path_sanitized, path_style)
-        details_paragraph_text = "N/A"
+        relative_path_sanitized = item_info['relative_path_sanitized']
+        details_text = "N/A"
+        status_color = None
+        row_background = None
 
         if status == 'Full':
-            status_paragraph = reportlab_platypus.Paragraph('Full', status_style_normal)
-            details_paragraph_text = f"{item_info['total_chars']} chars"
+            status_text = 'Full'
+            details_text = f"{item_info['total_chars']} chars"
         elif status == 'Partial':
-            percentage = int((item_info['extracted_chars'] / item_info['total_chars']) * 100) if item_info['total_chars'] else 0
-            status_paragraph = reportlab_platypus.Paragraph(f'Partial ({percentage}%)', status_style_partial)
-            details_paragraph_text = f"{item_info['extracted_chars']} / {item_info['total_chars']} chars"
+            if item_info['total_chars'] is not None:
+                total = item_info['total_chars']
+                details_text = f"{item_info['extracted_chars']} / {total} chars"
+                percentage = int((item_info['extracted_chars'] / total) * 100) if total else 0
+                status_text = f'Partial ({percentage}%)'
+            else: # Only a prefix of the file was read, so its size is known in bytes
+                details_text = f"{item_info['extracted_chars']} chars / {item_info['total_bytes']} bytes"
+                status_text = 'Partial' # Characters over bytes is not a meaningful percentage
+            status_color = reportlab_colors.red
         elif status == 'Non-Text':
-            status_paragraph = reportlab_platypus.Paragraph('Non-Text', status_style_normal)
+            status_text = 'Non-Text'
         else: # Error
-            status_paragraph = reportlab_platypus.Paragraph('Error', status_style_error)
-            details_paragraph_text = item_info.get('error_message', '')[:40] # Truncate long error messages
-            table_style_commands.append(('BACKGROUND', (0, i), (-1, i), reportlab_colors.lightpink)) # Highlight error rows
-
-        details_paragraph = reportlab_platypus.Paragraph(details_paragraph_text, details_style)
-        table_data.append([path_paragraph, status_paragraph, details_paragraph])
-    
-    # Define column widths (total width should be less than page width minus margins)
-    # Letter page width is 612 points. Margins typically 72 points each side (1 inch).
-    # Available width = 612 - 72 - 72 = 468 points.
-    table = reportlab_platypus.Table(table_data, colWidths=[300, 70, 98])
-    table.setStyle(reportlab_styles.TableStyle(table_style_commands))
-    return table
+            status_text = 'Error'
+            details_text = item_info.get('error_message', '')[:40] # Truncate long error messages
+            status_color = reportlab_colors.darkred
+            row_background = reportlab_colors.lightpink # Highlight error rows
+
+        # ~58 Courier / ~20 Helvetica characters fit the path / details columns at 8pt
+        cells = [_wrap_cell(relative_path_sanitized, 58), status_text, _wrap_cell(details_text, 20)]
+        rows.append((cells, status_color, row_background))
+
+    tables = []
+    for start in range(0, max(len(rows), 1), SUMMARY_ROWS_PER_TABLE): # An empty project still gets a header
+        table_data = [header]
+        table_style_commands = list(_STYLES.summary_table)
+        for i, (cells, status_color, row_background) in enumerate(rows[start:start + SUMMARY_ROWS_PER_TABLE], start=1):
+            table_data.append(cells)
+            if status_color:
+                table_style_commands.append(('TEXTCOLOR', (1, i), (1, i), status_color))
+            if row_background:
+                table_style_commands.append(('BACKGROUND', (0, i), (-1, i), row_background))
+
+        # Define column widths (total width should be less than page width minus margins)
+        # Letter page width is 612 points. Margins typically 72 points each side (1 inch).
+        # Available width = 612 - 72 - 72 = 468 points.
+        table = reportlab_platypus.Table(table_data, colWidths=[300, 70, 98], repeatRows=1)
+        table.setStyle(reportlab_platypus.TableStyle(table_style_commands))
+        tables.append(table)
+    return tables
 
 def generate_pdf(root_dir, output_pdf_path, 
                  max_code_len_cfg, max_data_len_cfg,
                  ignore_dirs_set_cfg, ignore_files_set_cfg,
                  code_ext_set_cfg, data_ext_set_cfg):
     """Generates the full PDF report."""
-    global reportlab_platypus, reportlab_styles, reportlab_colors, reportlab_pagesizes # Use globally imported modules
+    global reportlab_platypus, reportlab_pagesizes # Use globally imported modules
 
     abs_root_dir = os.path.abspath(root_dir)
+    # Suffix tuples for str.endswith; also matches extension-less names such as 'Podfile'
+    code_ext_tuple = tuple(ext.lower() for ext in code_ext_set_cfg)
+    data_ext_tuple = tuple(ext.lower() for ext in data_ext_set_cfg)
     project_name_sanitized = sanitize(os.path.basename(abs_root_dir))
     generation_timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    doc = reportlab_platypus.SimpleDocTemplate(output_pdf_path, pagesize=reportlab_pagesizes.letter)
-    
-    # Define styles
-    styles = reportlab_styles.getSampleStyleSheet()
-    heading1_style = styles['Heading1']
-    heading2_style = styles['Heading2']
-    meta_info_style = reportlab_styles.ParagraphStyle('MetaInfo', fontSize=9, textColor=reportlab_colors.darkgrey, spaceBefore=6)
-    tree_style = reportlab_styles.ParagraphStyle('DirectoryTree', fontName=MONO_FONT, fontSize=9, leading=11)
-    content_style = reportlab_styles.ParagraphStyle('FileContent', fontName=MONO_FONT, fontSize=8.5, leading=10)
+    # Defined here because ReportLab is only importable once main() has resolved it
+    class LazyPreformatted(reportlab_platypus.Preformatted):
+        """Preformatted block that loads its text when ReportLab lays it out and drops it once drawn."""
+        def __init__(self, load_text, style):
+            self.load_text = load_text
+            self.style = style
+            self.bulletText = None
+            self.lines = None
+
+        def wrap(self, availWidth, availHeight):
+            if self.lines is None:
+                reportlab_platypus.Preformatted.__init__(self, self.load_text(), self.style)
+            return reportlab_platypus.Preformatted.wrap(self, availWidth, availHeight)
+
+        def draw(self):
+            reportlab_platypus.Preformatted.draw(self)
+            self.lines = None # Release the text as soon as it is on the page
+
+    # Styles are shared across the run (see build_report_styles)
+    heading1_style = _STYLES.heading1
+    heading2_style = _STYLES.heading2
+    meta_info_style = _STYLES.meta_info
+    tree_style = _STYLES.tree
+    content_style = _STYLES.content
+
+    # A single walk produces both the directory tree lines and the list of files to report on.
+    # Each name is sanitized once; sanitized relative paths are built from the sanitized prefixes of
+    # the enclosing directories (sanitize works character by character, so this matches sanitizing the whole path).
+    tree_lines = [f"{project_name_sanitized}/"]
+    file_paths = [] # (full_path, relative_path, relative_path_sanitized)
+    sanitized_prefixes = [''] # Sanitized relative prefix for the contents of each open directory, by depth
+    for name, full_path, relative_path, depth, is_dir in iter_files(abs_root_dir, ignore_dirs_set_cfg, ignore_files_set_cfg):
+        indent = TREE_INDENTS[depth] if depth < len(TREE_INDENTS) else '  ' * depth
+        name_sanitized = sanitize(name)
+        if is_dir:
+            tree_lines.append(indent + name_sanitized + '/')
+            del sanitized_prefixes[depth + 1:]
+            sanitized_prefixes.append(sanitized_prefixes[depth] + name_sanitized + os.sep)
+        else:
+            tree_lines.append(indent + name_sanitized)
+            file_paths.append((full_path, relative_path, sanitized_prefixes[depth] + name_sanitized))
 
     story = [
         reportlab_platypus.Paragraph(f"Project Report: {project_name_sanitized}", heading1_style),
         reportlab_platypus.Paragraph(f"Generated: {generation_timestamp}<br/>Source Directory: {abs_root_dir}", meta_info_style),
         reportlab_platypus.Spacer(1, 12), # 12 points of vertical space
         reportlab_platypus.Paragraph("Directory Tree Overview", heading2_style),
-        reportlab_platypus.Preformatted(get_directory_tree(abs_root_dir, ignore_dirs_set_cfg, ignore_files_set_cfg), tree_style),
+        reportlab_platypus.Preformatted("\n".join(tree_lines), tree_style),
         reportlab_platypus.PageBreak(),
     ]
 
-    # Collect summary data
-    file_summary_data = []
-    for dirpath, dirnames, filenames in os.walk(abs_root_dir, topdown=True):
-        dirnames[:] = [d for d in dirnames if d not in ignore_dirs_set_cfg and not d.startswith('.')]
-        for filename in sorted(filenames):
-            if filename in ignore_files_set_cfg or filename.startswith('.'):
-                continue
-            full_path = os.path.join(dirpath, filename)
-            _, status_info = get_file_content_and_status(full_path, max_code_len_cfg, max_data_len_cfg, code_ext_set_cfg, data_ext_set_cfg)
-            status_info['relative_path'] = os.path.relpath(full_path, abs_root_dir)
-            file_summary_data.append(status_info)
+    # Collect summary data. The text read here is kept for the contents pass only while it fits in
+    # TEXT_CACHE_CHARS; anything beyond that budget is re-read lazily while the PDF is built, so
+    # memory stays bounded on large projects. Non-text files are classified by name alone and never opened.
+    def read_status(full_path):
+        status_info, limit = classify_file_status(full_path, max_code_len_cfg, max_data_len_cfg, code_ext_tuple, data_ext_tuple)
+        text = None
+        if status_info['status'] != 'Non-Text':
+            text = read_text_file(full_path, limit, status_info)
+        return status_info, limit, text
+
+    # Files are independent, so reads overlap in a thread pool (the GIL is released during I/O);
+    # executor.map keeps results in traversal order.
+    file_entries = [] # (relative_path_sanitized, full_path, status_info, limit)
+    text_cache = {} # full_path -> sanitized text; each entry is popped when its flowable loads it
+    cache_budget = TEXT_CACHE_CHARS
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        statuses = executor.map(read_status, (full_path for full_path, _, _ in file_paths))
+        for (full_path, relative_path, relative_path_sanitized), (status_info, limit, text) in zip(file_paths, statuses):
+            status_info['relative_path'] = relative_path
+            status_info['relative_path_sanitized'] = relative_path_sanitized
+            file_entries.append((relative_path_sanitized, full_path, status_info, limit))
+            if text is not None and len(text) <= cache_budget:
+                text_cache[full_path] = text
+                cache_budget -= len(text)
 
     story.extend([
         reportlab_platypus.Paragraph("File Extraction Summary", heading2_style),
-        generate_summary_table(file_summary_data),
+        *generate_summary_table([status_info for _, _, status_info, _ in file_entries]),
         reportlab_platypus.PageBreak(),
         reportlab_platypus.Paragraph("Detailed File Contents", heading2_style),
         reportlab_platypus.Spacer(1, 6),
     ])
 
     # Add file contents
-    for dirpath, dirnames, filenames in os.walk(abs_root_dir, topdown=True):
-        dirnames[:] = [d for d in dirnames if d not in ignore_dirs_set_cfg and not d.startswith('.')]
-        for filename in sorted(filenames):
-            if filename in ignore_files_set_cfg or filename.startswith('.'):
-                continue
-            
-            full_path = os.path.join(dirpath, filename)
-            relative_path_sanitized = sanitize(os.path.relpath(full_path, abs_root_dir))
-            
-            content_text, _ = get_file_content_and_status(full_path, max_code_len_cfg, max_data_len_cfg, code_ext_set_cfg, data_ext_set_cfg)
-            
-            story.extend([
-                reportlab_platypus.Paragraph(f"File: {relative_path_sanitized}", heading2_style),
-                reportlab_platypus.Preformatted(content_text, content_style),
-                reportlab_platypus.Spacer(1, 12),
-            ])
-
-    doc.build(story)
+    for relative_path_sanitized, full_path, status_info, limit in file_entries:
+        if status_info['status'] == 'Non-Text':
+            content_flowable = reportlab_platypus.Preformatted("[Non-text file; content not displayed]", content_style)
+        else:
+            def load_text(path=full_path, limit=limit):
+                """Hands over cached text once; otherwise re-reads, recording the status into a scratch dict."""
+                text = text_cache.pop(path, None)
+                if text is None: # Cached empty text ("") is still a hit
+                    text = read_text_file(path, limit, {})
+                return text
+            content_flowable = LazyPreformatted(load_text, content_style)
+        story.extend([
+            reportlab_platypus.Paragraph(f"File: {relative_path_sanitized}", heading2_style),
+            content_flowable,
+            reportlab_platypus.Spacer(1, 12),
+        ])
+
+    # Page compression is requested explicitly; invariant output (no embedded creation timestamps)
+    # makes re-runs over an unchanged project byte-for-byte reproducible apart from the 'Generated' line.
+    # File contents are read during build(), so the PDF goes to a temporary file that only replaces
+    # the output once the build succeeds; a failed build leaves no empty or partial PDF behind.
+    temp_pdf_path = output_pdf_path + '.tmp'
+    try:
+        doc = reportlab_platypus.SimpleDocTemplate(temp_pdf_path, pagesize=reportlab_pagesizes.letter,
+                                                   pageCompression=1, invariant=1)
+        doc.build(story)
+        os.replace(temp_pdf_path, output_pdf_path)
+    finally:
+        if os.path.exists(temp_pdf_path):
+            os.remove(temp_pdf_path)
     print(f"✅ PDF report generated successfully: {output_pdf_path}")
 
 # ─── MAIN EXECUTION ───────────────────────────────────────────────────────────
 def main():
     """Parses arguments, sets up configuration, and generates the PDF report."""
-    global reportlab_pagesizes, reportlab_platypus, reportlab_styles, reportlab_enums, reportlab_colors # Make them assignable
+    global reportlab_pagesizes, reportlab_platypus, reportlab_styles, reportlab_enums, reportlab_colors, _STYLES # Make them assignable
 
     parser = argparse.ArgumentParser(
         description="Generate a PDF report from a project directory, typically an Xcode project.",
@@ -285,19 +446,18 @@ def main():
     
     # Installation flag
     parser.add_argument('--no-auto-install', action='store_true',
-                        help="Disable automatic installation of missing 'reportlab' or 'pillow' libraries.")
+                        help="Disable automatic installation of the 'reportlab' library if it is missing.")
 
     args = parser.parse_args()
 
-    # --- Attempt to import or install ReportLab/Pillow ---
+    # --- Attempt to import or install ReportLab ---
     try:
         from reportlab.lib import pagesizes as rl_pagesizes
         from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Preformatted, Table, TableStyle, PageBreak
         from reportlab.lib.styles import getSampleStyleSheet as rl_getSampleStyleSheet
         from reportlab.lib.enums import TA_LEFT, TA_CENTER
         from reportlab.lib import colors as rl_colors
-        # Pillow is an implicit dependency for images in ReportLab, ensure it's mentioned
-        import PIL 
+        # Pillow is deliberately not probed: the report is text-only and importing PIL only slows startup
         
         # Assign to global scope for use in helper functions
         reportlab_pagesizes = rl_pagesizes
@@ -305,11 +465,12 @@ def main():
         reportlab_styles = sys.modules['reportlab.lib.styles']
         reportlab_enums = sys.modules['reportlab.lib.enums']
         reportlab_colors = rl_colors
+        _STYLES = build_report_styles()
 
     except ImportError:
         if not args.no_auto_install:
-            print("Required libraries (reportlab or pillow) not found. Attempting to install...")
-            pip_command = [sys.executable, "-m", "pip", "install", "--user", "reportlab", "pillow"]
+            print("Required library 'reportlab' not found. Attempting to install...")
+            pip_command = [sys.executable, "-m", "pip", "install", "--user", "reportlab"]
             # Handle macOS specific flag if needed (though --user often suffices)
             if sys.platform == "darwin":
                  # For newer pip versions on system Python, this might be needed.
@@ -320,15 +481,15 @@ def main():
 
             try:
                 subprocess.check_call(pip_command)
-                print("Libraries installed successfully. Please re-run the script.")
+                print("ReportLab installed successfully. Please re-run the script.")
                 sys.exit(0) # Exit for user to re-run, as imports need to be re-evaluated
             except subprocess.CalledProcessError as e:
                 print(f"Error during installation: {e}")
-                print("Please install them manually: 'pip install reportlab pillow'")
+                print("Please install it manually: 'pip install reportlab'")
                 sys.exit(1)
         else:
-            print("Error: Required libraries 'reportlab' and 'pillow' are not installed.")
-            print("Please install them manually (e.g., 'pip install reportlab pillow') or run without --no-auto-install.")
+            print("Error: Required library 'reportlab' is not installed.")
+            print("Please install it manually (e.g., 'pip install reportlab') or run without --no-auto-install.")
             sys.exit(1)
     
     # --- Process Configuration from Arguments ---
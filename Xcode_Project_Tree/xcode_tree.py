@@ -8,7 +8,7 @@ including resolving synchronized folder references by scanning the file system.
 
 import os
 import sys
-from pathlib import Path # For easier path manipulation and directory scanning
+import glob
 from pbxproj import XcodeProject
 
 # --- Configuration ---
@@ -19,11 +19,9 @@ try:
     # YourProject/YourProject.xcodeproj
     project_root_dir = os.path.dirname(script_dir) 
     
-    xcodeproj_name = None
-    for item in os.listdir(project_root_dir):
-        if item.endswith(".xcodeproj"):
-            xcodeproj_name = item
-            break
+    # glob filters the directory listing down to the .xcodeproj bundles (escaped in case the path contains wildcards)
+    xcodeproj_matches = glob.glob(os.path.join(glob.escape(project_root_dir), "*.xcodeproj"))
+    xcodeproj_name = os.path.basename(xcodeproj_matches[0]) if xcodeproj_matches else None
     
     if not xcodeproj_name:
         # Fallback: try to infer from the parent directory name if script is directly in project dir
@@ -49,34 +47,113 @@ except Exception as e:
     sys.exit(1)
 # --- End Configuration ---
 
-TARGETS_BY_NAME_CACHE = {} # Cache for PBXNativeTarget objects by name
+TARGETS_BY_NAME_CACHE = None # Cache for PBXNativeTarget objects by name; built on first lookup (see _lookup_target)
+RESOLVED_PATH_CACHE = {} # Cache of resolved filesystem paths by id() of the project item
+DISPLAY_NAME_CACHE = {} # Cache of display names by id() of the project item
+PRODUCT_NAME_BY_TARGET_ID = {} # Display name of each target's product (None if unresolvable) by id() of the target
+OBJECTS_BY_ID = {} # Every object in the loaded project by its ID, built once per load
+OUTPUT_LINES = [] # Tree lines collected during a run and written to stdout in one go
+TARGET_NAME_SUFFIXES = ('', 'Extension', 'Widget') # Suffixes tried when matching a synced group to its target (widgets/extensions)
+INDENTS = tuple("  " * level for level in range(64)) # Indent strings by level, built once
+
+def get_indent(indent_level):
+    """Returns the indent string for a tree level; levels beyond the precomputed table are built on demand."""
+    return INDENTS[indent_level] if indent_level < len(INDENTS) else "  " * indent_level
+
+# Extensions of files shown when scanning synchronized folders (matched case-insensitively)
+SOURCE_EXTENSIONS = frozenset({
+    '.swift', '.m', '.mm', '.c', '.cpp', '.h', '.hpp', 
+    '.storyboard', '.xib', '.plist', '.json',         
+    '.xcassets', '.dataset', '.mlmodel', '.playground', # Bundles treated as files
+    '.intentdefinition', '.strings', '.stringsdict',   
+    '.entitlements', '.md', '.txt', '.rtf',
+    '.png', '.jpg', '.jpeg', '.gif', '.heic', '.svg', '.pdf', 
+    '.ttf', '.otf', 
+    '.wav', '.mp3', '.aac', '.m4a' 
+})
+# Build artifacts and dependency folders skipped by the synced-folder scan (hidden entries are always skipped)
+IGNORED_DIRS = frozenset({'__pycache__', 'build', 'DerivedData', 'Pods'})
+# Directory bundles Xcode shows as a single item; the scan lists them with their icon and does not descend
+BUNDLE_SUFFIXES = {
+    '.xcassets': "🎨",
+    '.playground': "🎈",
+    '.xcdatamodeld': "🗄️",
+    '.bundle': "📦",
+    '.framework': "🧰",
+    '.mlmodel': "🤖", '.mlpackage': "🤖",
+}
+
+# Icons by extension, shared by filesystem scans and project file references; anything else gets the default file icon
+EXT_ICON = {
+    '.swift': "𝑺",
+    '.h': "𝒉", '.hpp': "𝒉",
+    '.m': "𝒎", '.mm': "𝒎", '.c': "𝒎", '.cpp': "𝒎",
+    '.json': "｛｝",
+    '.plist': "⚙️",
+    '.intentdefinition': "💡",
+    '.strings': "🌍", '.stringsdict': "🌍",
+    '.entitlements': "🔑",
+    '.storyboard': "📱", '.xib': "📱",
+    '.png': "🖼️", '.jpg': "🖼️", '.jpeg': "🖼️", '.gif': "🖼️", '.heic': "🖼️", '.svg': "🖼️",
+    '.pdf': "📰",
+    **BUNDLE_SUFFIXES, # Bundles referenced as single files in the project
+}
+
+def get_file_icon(file_name):
+    """Returns the icon for a file name based on its (case-insensitive) extension."""
+    dot = file_name.rfind('.')
+    return EXT_ICON.get(file_name[dot:].lower() if dot >= 0 else '', "📄") # Default file icon
+
+def _source_tree(obj):
+    """Returns the item's sourceTree (e.g. '<group>', 'SOURCE_ROOT'), or None; pbxproj exposes the raw key name."""
+    return getattr(obj, 'sourceTree', None)
 
 def get_display_name(obj):
     """Gets the display name for an Xcode project item, preferring path for blue folders if name is just basename."""
+    cache_key = id(obj)
+    if cache_key in DISPLAY_NAME_CACHE:
+        return DISPLAY_NAME_CACHE[cache_key]
+    display_name = _compute_display_name(obj)
+    DISPLAY_NAME_CACHE[cache_key] = display_name
+    return display_name
+
+def _compute_display_name(obj):
+    """Uncached name lookup behind get_display_name."""
     name = getattr(obj, 'name', None)
     path = getattr(obj, 'path', None)
+    isa = getattr(obj, 'isa', None)
     if name:
         # For groups that are folder references (blue folders), path might be more descriptive
         # if the name is just the last component of that path.
-        if path and obj.isa in ['PBXGroup', 'PBXFileSystemSynchronizedRootGroup'] and \
-           getattr(obj, 'source_tree', 'GROUP') != 'GROUP' and name == os.path.basename(path):
+        if path and isa in ['PBXGroup', 'PBXFileSystemSynchronizedRootGroup'] and \
+           _source_tree(obj) not in (None, 'GROUP') and name == os.path.basename(path):
             return path 
         return name
     elif path:
         # For file references, path is often just the filename.
         # For groups without a name, path might be the folder name.
         return os.path.basename(path) 
-    elif hasattr(obj, 'isa'):
-        return f"Unnamed {obj.isa}" # Fallback if no name or path
+    elif isa is not None:
+        return f"Unnamed {isa}" # Fallback if no name or path
     return "Unknown Item"
 
 def get_resolved_path_for_group_item(project, item_obj, current_project_root_dir):
     """
     Resolves the filesystem path for a PBXFileReference or PBXGroup.
-    Returns an absolute path or None if not resolvable.
+    Returns an absolute path or None if not resolvable; current_project_root_dir must be absolute.
+    Results are cached, so ancestors shared by many items are only resolved once.
     """
+    cache_key = id(item_obj)
+    if cache_key in RESOLVED_PATH_CACHE:
+        return RESOLVED_PATH_CACHE[cache_key]
+    resolved = _resolve_path_for_group_item(project, item_obj, current_project_root_dir)
+    RESOLVED_PATH_CACHE[cache_key] = resolved
+    return resolved
+
+def _resolve_path_for_group_item(project, item_obj, current_project_root_dir):
+    """Uncached path resolution behind get_resolved_path_for_group_item."""
     path = getattr(item_obj, 'path', None)
-    source_tree = getattr(item_obj, 'source_tree', None) 
+    source_tree = _source_tree(item_obj)
     # item_display_name = get_display_name(item_obj) # For debug clarity
 
     # print(f"# DEBUG_PATH: Trying to resolve path for '{item_display_name}' (ISA: {item_obj.isa}). Path='{path}', SourceTree='{source_tree}'")
@@ -99,24 +176,24 @@ def get_resolved_path_for_group_item(project, item_obj, current_project_root_dir
         return None
 
     if effective_source_tree == 'SOURCE_ROOT':
-        resolved = os.path.abspath(os.path.join(current_project_root_dir, path))
+        resolved = os.path.normpath(os.path.join(current_project_root_dir, path))
         # print(f"# DEBUG_PATH: Resolved '{item_display_name}' (SOURCE_ROOT) to: {resolved}")
         return resolved
     elif effective_source_tree == '<group>':
         parent_id = getattr(item_obj, 'parent', None)
         if parent_id:
-            parent_obj = project.get_object(parent_id)
+            parent_obj = OBJECTS_BY_ID.get(parent_id)
             if parent_obj:
                 # print(f"# DEBUG_PATH: Group '{item_display_name}' is relative to parent '{get_display_name(parent_obj)}'. Resolving parent path...")
                 parent_full_path = get_resolved_path_for_group_item(project, parent_obj, current_project_root_dir)
                 if parent_full_path and os.path.isdir(parent_full_path):
-                    resolved = os.path.abspath(os.path.join(parent_full_path, path))
+                    resolved = os.path.normpath(os.path.join(parent_full_path, path))
                     # print(f"# DEBUG_PATH: Resolved '{item_display_name}' (<group>) to: {resolved}")
                     return resolved
                 # else:
                     # print(f"# DEBUG_PATH: Parent path for '{item_display_name}' not resolvable or not a directory: {parent_full_path}")
         # print(f"# DEBUG_PATH: <group> for '{item_display_name}' - trying fallback relative to project root as parent resolution failed or no parent.")
-        resolved = os.path.abspath(os.path.join(current_project_root_dir, path))
+        resolved = os.path.normpath(os.path.join(current_project_root_dir, path))
         # print(f"# DEBUG_PATH: Resolved '{item_display_name}' (<group> fallback) to: {resolved}")
         return resolved
     elif effective_source_tree == '<absolute>':
@@ -127,91 +204,129 @@ def get_resolved_path_for_group_item(project, item_obj, current_project_root_dir
         # print(f"# DEBUG_PATH: Unhandled effective_source_tree '{effective_source_tree}' for path resolution of '{item_display_name}'. Cannot resolve.")
         return None
 
+def _list_synced_dir(directory_path):
+    """Returns the entries of directory_path sorted by name, skipping hidden files/folders and build artifacts."""
+    # os.scandir gives each entry's type from the directory listing itself,
+    # so there is no extra stat() per entry as with os.listdir + os.path.isdir
+    # Names are filtered before anything else touches the entry, so skipped ones never reach is_dir()
+    with os.scandir(directory_path) as entries:
+        return sorted((entry for entry in entries
+                       if entry.name[0] != '.' and entry.name not in IGNORED_DIRS),
+                      key=lambda e: e.name)
+
+def _join_group_path(item_obj, parent_fs_path):
+    """
+    Resolves a '<group>'-relative item against its parent group's already-resolved path.
+    Returns None when that shortcut does not apply (no parent path, or another source tree);
+    callers then fall back to get_resolved_path_for_group_item.
+    """
+    if parent_fs_path is None or _source_tree(item_obj) != '<group>':
+        return None
+    path = getattr(item_obj, 'path', None)
+    return os.path.normpath(os.path.join(parent_fs_path, path)) if path else parent_fs_path # A group without a path shares its parent's folder
+
 def print_filesystem_tree_for_synced_group(directory_path, indent_level):
     """
     Prints a tree of recognized source/resource files and folders from a given filesystem directory.
+    Walks the tree with an explicit stack of per-directory entry iterators rather than recursing,
+    so each subdirectory's contents are still printed directly under its line.
     """
     # print(f"# DEBUG_SCAN: Attempting FS scan for synced group at: {directory_path}")
-    source_extensions = [ # More comprehensive list of extensions
-        '.swift', '.m', '.mm', '.c', '.cpp', '.h', '.hpp', 
-        '.storyboard', '.xib', '.plist', '.json',         
-        '.xcassets', '.dataset', '.mlmodel', '.playground', # Bundles treated as files
-        '.intentdefinition', '.strings', '.stringsdict',   
-        '.entitlements', '.md', '.txt', '.rtf',
-        '.png', '.jpg', '.jpeg', '.gif', '.heic', '.svg', '.pdf', 
-        '.ttf', '.otf', 
-        '.wav', '.mp3', '.aac', '.m4a' 
-    ]
-    initial_indent_str = "  " * indent_level
-    
     if not directory_path or not os.path.isdir(directory_path):
         # This case should ideally be handled by the caller, but as a safeguard:
-        # print(f"{initial_indent_str}⚠️ Path not found or not a directory for FS scan: {directory_path}")
+        # print(f"{get_indent(indent_level)}⚠️ Path not found or not a directory for FS scan: {directory_path}")
         return False # Indicate no files were found or path was bad
 
-    found_any_recognizable_items = False
-    
-    items_to_print = []
     try:
-        for item_name in sorted(os.listdir(directory_path)):
-            # Skip common hidden files/folders and build artifacts
-            if item_name.startswith('.') or item_name in ['__pycache__', 'build', 'DerivedData']: 
-                continue
-            item_path = os.path.join(directory_path, item_name)
-            is_dir = os.path.isdir(item_path)
-            items_to_print.append({'name': item_name, 'path': item_path, 'is_dir': is_dir})
+        top_entries = _list_synced_dir(directory_path)
     except Exception as e:
-        # print(f"{initial_indent_str}⚠️ Error listing directory {directory_path}: {e}")
+        # print(f"{get_indent(indent_level)}⚠️ Error listing directory {directory_path}: {e}")
         return False
 
-    # if not items_to_print and indent_level > 0: 
-        # print(f"# DEBUG_SCAN: Directory '{directory_path}' is empty or contains only hidden/ignored files/folders.")
-
-    for item in items_to_print:
-        item_name = item['name']
-        item_path = item['path']
-        is_dir = item['is_dir']
-        
-        if is_dir:
-            # Special handling for bundles that look like files in Xcode
-            if item_name.endswith(".xcassets"):
-                print(f"{initial_indent_str}🎨 {item_name}")
-                found_any_recognizable_items = True
-            elif item_name.endswith(".playground"):
-                print(f"{initial_indent_str}🎈 {item_name}") 
+    found_any_recognizable_items = False
+    stack = [(iter(top_entries), indent_level, get_indent(indent_level))] # (remaining entries, indent level, indent string)
+    while stack:
+        entries, level, indent_str = stack[-1]
+        entry = next(entries, None)
+        if entry is None: # Directory finished; continue with its parent
+            stack.pop()
+            continue
+        item_name = entry.name
+
+        if entry.is_dir():
+            # Special handling for bundles that look like files in Xcode: one line, no descent into their contents
+            dot = item_name.rfind('.')
+            bundle_icon = BUNDLE_SUFFIXES.get(item_name[dot:].lower()) if dot >= 0 else None
+            if bundle_icon:
+                OUTPUT_LINES.append(f"{indent_str}{bundle_icon} {item_name}")
                 found_any_recognizable_items = True
-            # Add other bundle types here if needed (e.g., .xcdatamodeld)
             else:
-                print(f"{initial_indent_str}📁 {item_name}")
+                OUTPUT_LINES.append(f"{indent_str}📁 {item_name}")
                 found_any_recognizable_items = True 
-                # Recurse for subdirectories
-                print_filesystem_tree_for_synced_group(item_path, indent_level + 1)
+                # Descend into the subdirectory next; an unreadable one is listed but left empty
+                try:
+                    stack.append((iter(_list_synced_dir(entry.path)), level + 1, get_indent(level + 1)))
+                except Exception:
+                    pass
         else: # It's a file
-            file_ext = Path(item_name).suffix.lower()
-            # Check if the extension is in our list of source_extensions
-            is_recognized_file = any(item_name.endswith(ext) for ext in source_extensions)
-
-            if is_recognized_file:
+            # Slice the suffix directly; os.path.splitext does more work than a file name needs
+            dot = item_name.rfind('.')
+            file_ext = item_name[dot:].lower() if dot >= 0 else ''
+            # One set lookup instead of an endswith() test per known extension
+            if file_ext in SOURCE_EXTENSIONS:
                 found_any_recognizable_items = True
-                icon = "📄" # Default file icon
-                if file_ext == ".swift": icon = "𝑺"
-                elif file_ext in (".h", ".hpp"): icon = "𝒉"
-                elif file_ext in (".m", ".mm", ".c", ".cpp"): icon = "𝒎"
-                elif file_ext == ".json": icon = "｛｝"
-                elif file_ext == ".plist": icon = "⚙️"
-                elif file_ext == ".intentdefinition": icon = "💡"
-                elif file_ext == ".strings" or file_ext == ".stringsdict": icon = "🌍"
-                elif file_ext == ".entitlements": icon = "🔑"
-                elif file_ext in (".storyboard", ".xib"): icon = "📱"
-                elif file_ext in (".png", ".jpg", ".jpeg", ".gif", ".heic", ".svg"): icon = "🖼️"
-                elif file_ext == ".pdf": icon = "📰"
-                # Add more specific icons as needed
-                print(f"{initial_indent_str}{icon} {item_name}")
+                icon = EXT_ICON.get(file_ext, "📄") # Default file icon
+                OUTPUT_LINES.append(f"{indent_str}{icon} {item_name}")
             # else:
-                # print(f"# DEBUG_SCAN: Skipping file (not in recognized extensions): {item_name} in {directory_path}")
+                # print(f"# DEBUG_SCAN: Skipping file (not in recognized extensions): {item_name} in {entry.path}")
 
     return found_any_recognizable_items
 
+def _lookup_target(project, target_name):
+    """
+    Returns the PBXNativeTarget named target_name, or None.
+    Targets are only needed when a synced group's filesystem scan comes up empty, so the
+    name cache is built on the first lookup rather than for every project.
+    """
+    global TARGETS_BY_NAME_CACHE
+    if TARGETS_BY_NAME_CACHE is None:
+        # pbxproj already groups objects by isa, so this reads the PBXNativeTarget section directly
+        # instead of resolving each ID in the project's target list.
+        # print("# DEBUG: Populating TARGETS_BY_NAME_CACHE...") # Optional: Keep this if needed for new projects
+        TARGETS_BY_NAME_CACHE = {}
+        for target in project.objects.get_objects_in_section('PBXNativeTarget'):
+            TARGETS_BY_NAME_CACHE[get_display_name(target)] = target
+        # print(f"# DEBUG: TARGETS_BY_NAME_CACHE populated with {len(TARGETS_BY_NAME_CACHE)} native targets.")
+    return TARGETS_BY_NAME_CACHE.get(target_name)
+
+def _get_product_name(target_obj):
+    """Returns the display name of a target's product, or None; resolved once per target."""
+    cache_key = id(target_obj)
+    if cache_key not in PRODUCT_NAME_BY_TARGET_ID:
+        product_ref_id = getattr(target_obj, 'productReference', None)
+        product_ref = OBJECTS_BY_ID.get(product_ref_id) if product_ref_id else None
+        PRODUCT_NAME_BY_TARGET_ID[cache_key] = get_display_name(product_ref) if product_ref else None
+    return PRODUCT_NAME_BY_TARGET_ID[cache_key]
+
+def _emit_target_product(target_obj, indent_level, label="Product"):
+    """Adds the '➡️ Product' line for a target. Returns True if the target has a resolvable product."""
+    product_name = _get_product_name(target_obj)
+    if product_name is None:
+        return False
+    OUTPUT_LINES.append(f"{get_indent(indent_level)}➡️ {label}: {product_name}")
+    return True
+
+def _emit_product_for_group(project, group_name, indent_level, label="Product"):
+    """
+    Fallback for synced groups: finds the target named after the group (trying TARGET_NAME_SUFFIXES in order)
+    and adds its product line. Returns True if a product line was added.
+    """
+    for suffix in TARGET_NAME_SUFFIXES:
+        target_obj = _lookup_target(project, group_name + suffix)
+        if target_obj:
+            return _emit_target_product(target_obj, indent_level, label)
+    return False
+
 def print_target_files_from_buildphase(project, target_obj, indent_level_for_files):
     """
     Prints source files from a target's PBXSourcesBuildPhase.
@@ -219,44 +334,60 @@ def print_target_files_from_buildphase(project, target_obj, indent_level_for_fil
     Returns True if any source file was printed, False otherwise.
     """
     target_name_for_debug = get_display_name(target_obj)
-    file_indent_str = "  " * indent_level_for_files
+    file_indent_str = get_indent(indent_level_for_files)
     any_source_files_printed = False # Specifically track if source files were printed
     
     build_phases = getattr(target_obj, 'buildPhases', [])
     for build_phase_id in build_phases:
-        build_phase = project.get_object(build_phase_id)
+        build_phase = OBJECTS_BY_ID.get(build_phase_id)
         if build_phase and build_phase.isa == 'PBXSourcesBuildPhase':
             phase_files = getattr(build_phase, 'files', [])
             # if not phase_files:
                 # print(f"# INFO: PBXSourcesBuildPhase for '{target_name_for_debug}' has an empty 'files' list (as per pbxproj library).")
             
             for build_file_id in phase_files: # This loop won't run if phase_files is empty
-                build_file = project.get_object(build_file_id)
+                build_file = OBJECTS_BY_ID.get(build_file_id)
                 if build_file and hasattr(build_file, 'fileRef') and build_file.fileRef:
-                    file_ref = project.get_object(build_file.fileRef)
+                    file_ref = OBJECTS_BY_ID.get(build_file.fileRef)
                     if file_ref:
                         any_source_files_printed = True 
                         file_display_name = get_display_name(file_ref)
-                        file_icon = "📄"; 
-                        if file_display_name.endswith(".swift"): file_icon = "𝑺"
-                        # Add more icon logic if needed
-                        print(f"{file_indent_str}{file_icon} {file_display_name} (from build phase)")
+                        file_icon = get_file_icon(file_display_name)
+                        OUTPUT_LINES.append(f"{file_indent_str}{file_icon} {file_display_name} (from build phase)")
             break # Typically only one main sources phase to process for this purpose
     
     # If no source files were printed from the build phase, then print the product
     if not any_source_files_printed:
-        product_ref_id = getattr(target_obj, 'productReference', None)
-        if product_ref_id:
-            product_ref = project.get_object(product_ref_id)
-            if product_ref:
-                print(f"{file_indent_str}➡️ Product: {get_display_name(product_ref)}")
+        _emit_target_product(target_obj, indent_level_for_files)
     return any_source_files_printed
 
+def _write_output(text):
+    """
+    Writes text to stdout as UTF-8 straight to the file descriptor, bypassing the TextIOWrapper.
+    Falls back to sys.stdout.write when stdout has no usable descriptor (e.g. when captured by an IDE).
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        sys.stdout.write(text)
+        return
+    sys.stdout.flush() # Keep anything printed earlier ahead of the tree
+    data = memoryview(text.encode('utf-8'))
+    while data: # os.write may write less than requested to pipes
+        written = os.write(fd, data)
+        data = data[written:]
+
 def print_project_structure(project_file_bundle_path, project_root_for_paths):
     """Loads the Xcode project and initiates the recursive printing of its structure."""
-    global TARGETS_BY_NAME_CACHE
-    TARGETS_BY_NAME_CACHE = {} # Reset cache for each call
-
+    global TARGETS_BY_NAME_CACHE, RESOLVED_PATH_CACHE, DISPLAY_NAME_CACHE, PRODUCT_NAME_BY_TARGET_ID, OBJECTS_BY_ID, OUTPUT_LINES
+    TARGETS_BY_NAME_CACHE = None # Reset cache for each call
+    RESOLVED_PATH_CACHE = {}
+    DISPLAY_NAME_CACHE = {}
+    PRODUCT_NAME_BY_TARGET_ID = {}
+    OUTPUT_LINES = []
+
+    # Made absolute once here so item paths joined onto it only need os.path.normpath (no getcwd() per item)
+    project_root_for_paths = os.path.abspath(project_root_for_paths)
     pbxproj_file_path = os.path.join(project_file_bundle_path, 'project.pbxproj')
     if not os.path.exists(pbxproj_file_path):
         print(f"Error: project.pbxproj not found at {pbxproj_file_path}"); return
@@ -265,68 +396,68 @@ def print_project_structure(project_file_bundle_path, project_root_for_paths):
     except Exception as e:
         print(f"Error loading project '{pbxproj_file_path}': {e}"); return
 
+    # Index every object once; all later ID lookups are plain dict hits
+    OBJECTS_BY_ID = {object_id: project.objects[object_id] for object_id in project.objects.get_keys()}
+
     # Get the main PBXProject object
     if not hasattr(project, 'rootObject'): print(f"Error: Project lacks 'rootObject'"); return
     root_object_id = project.rootObject
     if not root_object_id: print(f"Error: Project's rootObject ID missing"); return
-    project_obj = project.get_object(root_object_id) 
-    if not project_obj : # Fallback, though get_object should work if ID is valid
-         if root_object_id in project.objects: project_obj = project.objects[root_object_id]
+    project_obj = OBJECTS_BY_ID.get(root_object_id)
     if not project_obj: print(f"Error: Could not retrieve root PBXProject object"); return
     if not hasattr(project_obj, 'isa') or project_obj.isa != 'PBXProject':
         print(f"Error: Root object is not PBXProject. ISA: '{getattr(project_obj, 'isa', 'N/A')}'"); return
 
-    # Cache all native targets by name for quick lookup
-    if hasattr(project_obj, 'targets'):
-        # print("# DEBUG: Populating TARGETS_BY_NAME_CACHE...") # Optional: Keep this if needed for new projects
-        for target_id in project_obj.targets:
-            target = project.get_object(target_id)
-            # Ensure we only cache PBXNativeTarget objects
-            if target and hasattr(target, 'isa') and target.isa == 'PBXNativeTarget':
-                target_name = get_display_name(target)
-                TARGETS_BY_NAME_CACHE[target_name] = target
-                # print(f"# DEBUG:   Cached target: '{target_name}'")
-        # print(f"# DEBUG: TARGETS_BY_NAME_CACHE populated with {len(TARGETS_BY_NAME_CACHE)} native targets.")
-    
     # Get the main group (root of the Project Navigator tree)
     main_group_id = project_obj.mainGroup
     if not main_group_id: print(f"Error: mainGroup ID missing"); return
-    main_group = project.get_object(main_group_id)
+    main_group = OBJECTS_BY_ID.get(main_group_id)
     if not main_group: print(f"Error: Could not retrieve main group"); return
 
-    print(f"Xcode Project Structure for: {os.path.basename(project_file_bundle_path)}")
-    print("----------------------------------------------------")
-    _print_recursive(project, main_group, 0, project_root_for_paths) # Pass project_root_for_paths
-    print("----------------------------------------------------")
+    OUTPUT_LINES.append(f"Xcode Project Structure for: {os.path.basename(project_file_bundle_path)}")
+    OUTPUT_LINES.append("----------------------------------------------------")
+    # The main group lives in the project root, which seeds the top-down path threading
+    _print_recursive(project, main_group, 0, project_root_for_paths, project_root_for_paths) # Pass project_root_for_paths
+    OUTPUT_LINES.append("----------------------------------------------------")
+    # One write for the whole tree instead of a print() (and stdout lock/flush) per line
+    _write_output("\n".join(OUTPUT_LINES) + "\n")
 
-def _print_recursive(project, current_item, indent_level, current_project_root_dir):
-    """Recursively prints the project structure."""
-    global TARGETS_BY_NAME_CACHE
+def _print_recursive(project, current_item, indent_level, current_project_root_dir, parent_fs_path=None):
+    """
+    Recursively prints the project structure.
+    parent_fs_path is the parent group's resolved folder (if known), so '<group>'-relative children
+    resolve with one join instead of walking back up their ancestors.
+    """
     display_name = get_display_name(current_item)
     icon = "❔" # Default icon
-    indent_prefix = "  " * indent_level
+    indent_prefix = get_indent(indent_level)
+    # Attributes are read once up front; each getattr on a pbxproj object is a full attribute lookup
+    isa = current_item.isa
+    children = getattr(current_item, 'children', None)
 
-    if current_item.isa == 'PBXGroup' or current_item.isa == 'PBXFileSystemSynchronizedRootGroup':
-        is_synced_group = current_item.isa == 'PBXFileSystemSynchronizedRootGroup'
+    if isa == 'PBXGroup' or isa == 'PBXFileSystemSynchronizedRootGroup':
+        is_synced_group = isa == 'PBXFileSystemSynchronizedRootGroup'
         
         if is_synced_group: icon = "🔗" # Link icon for Synced Group
-        elif hasattr(current_item, 'path') and current_item.path and getattr(current_item, 'source_tree', '<group>') != '<group>': icon = "🟦" # Blue folder reference
+        elif getattr(current_item, 'path', None) and _source_tree(current_item) not in (None, '<group>'): icon = "🟦" # Blue folder reference
         else: icon = "🗂️" # Yellow virtual group
-        print(f"{indent_prefix}{icon} {display_name}")
+        OUTPUT_LINES.append(f"{indent_prefix}{icon} {display_name}")
+        group_fs_path = _join_group_path(current_item, parent_fs_path)
 
         # For regular (yellow) groups, process children explicitly listed in the pbxproj
         # For synced groups, we prioritize filesystem scan below.
-        if not is_synced_group and hasattr(current_item, 'children') and current_item.children:
-            # print(f"# DEBUG_RECURSE: Regular Group '{display_name}' has {len(current_item.children)} pbxproj children.")
-            for child_id in current_item.children:
-                child_obj = project.get_object(child_id)
+        if not is_synced_group and children:
+            # print(f"# DEBUG_RECURSE: Regular Group '{display_name}' has {len(children)} pbxproj children.")
+            for child_id in children:
+                child_obj = OBJECTS_BY_ID.get(child_id)
                 if child_obj:
-                    _print_recursive(project, child_obj, indent_level + 1, current_project_root_dir)
+                    _print_recursive(project, child_obj, indent_level + 1, current_project_root_dir, group_fs_path)
         
         # For synchronized groups (blue folders / PBXFileSystemSynchronizedRootGroup), scan the filesystem
         if is_synced_group:
             # print(f"# DEBUG_SYNC_GROUP_MAIN: Processing Synced Group: '{display_name}' (ISA: {current_item.isa})")
-            group_fs_path = get_resolved_path_for_group_item(project, current_item, current_project_root_dir)
+            if not (group_fs_path and os.path.isdir(group_fs_path)):
+                group_fs_path = get_resolved_path_for_group_item(project, current_item, current_project_root_dir)
             # print(f"# DEBUG_SYNC_GROUP_MAIN: Resolved path for '{display_name}': {group_fs_path}") 
 
             if group_fs_path and os.path.isdir(group_fs_path):
@@ -337,78 +468,39 @@ def _print_recursive(project, current_item, indent_level, current_project_root_d
                 # then try to print the associated target's product as a fallback.
                 if not filesystem_files_found: 
                     # print(f"# DEBUG_SYNC_GROUP_MAIN: FS scan for '{display_name}' empty or no recognized files. Checking for associated target product.")
-                    actual_target_to_process = None
-                    potential_target_name_1 = display_name
-                    potential_target_name_2 = display_name + "Extension" # Heuristic for widgets
-
-                    if potential_target_name_1 in TARGETS_BY_NAME_CACHE:
-                        actual_target_to_process = TARGETS_BY_NAME_CACHE[potential_target_name_1]
-                    elif potential_target_name_2 in TARGETS_BY_NAME_CACHE:
-                        actual_target_to_process = TARGETS_BY_NAME_CACHE[potential_target_name_2]
-                    
-                    if actual_target_to_process:
-                        product_ref_id = getattr(actual_target_to_process, 'productReference', None)
-                        if product_ref_id:
-                            product_ref = project.get_object(product_ref_id)
-                            if product_ref:
-                                print(f"{'  ' * (indent_level + 1)}➡️ Product: {get_display_name(product_ref)}")
+                    _emit_product_for_group(project, display_name, indent_level + 1)
             # elif group_fs_path: # Path was resolved but not a directory
             #      print(f"# DEBUG_SYNC_GROUP_MAIN: Resolved path for '{display_name}' is NOT a directory: {group_fs_path}")
             # else: # Path resolution failed
             #      print(f"# DEBUG_SYNC_GROUP_MAIN: Could NOT resolve filesystem path for '{display_name}'. Fallback to target product.")
-            #      # Fallback logic for when path resolution itself fails for a synced group
-            #      actual_target_to_process = None
-            #      potential_target_name_1 = display_name
-            #      potential_target_name_2 = display_name + "Extension"
-            #      if potential_target_name_1 in TARGETS_BY_NAME_CACHE: actual_target_to_process = TARGETS_BY_NAME_CACHE[potential_target_name_1]
-            #      elif potential_target_name_2 in TARGETS_BY_NAME_CACHE: actual_target_to_process = TARGETS_BY_NAME_CACHE[potential_target_name_2]
-            #      if actual_target_to_process:
-            #          # This would call the function that relies on PBXSourcesBuildPhase.files, which we know is problematic
-            #          # print_target_files_from_buildphase(project, actual_target_to_process, indent_level + 1)
-            #          # Instead, just print product if path resolution failed for a synced group
-            #          product_ref_id = getattr(actual_target_to_process, 'productReference', None)
-            #          if product_ref_id:
-            #              product_ref = project.get_object(product_ref_id)
-            #              if product_ref: print(f"{'  ' * (indent_level + 1)}➡️ Product (path error): {get_display_name(product_ref)}")
-
-
-    elif current_item.isa == 'PBXFileReference':
-        icon = "📄" # Default file icon
-        if display_name.endswith(".swift"): icon = "𝑺"
-        elif display_name.endswith((".h", ".hpp")): icon = "𝒉"
-        elif display_name.endswith((".m", ".mm", ".c", ".cpp")): icon = "𝒎"
-        elif display_name.endswith((".png", ".jpg", ".jpeg", ".gif", ".heic")): icon = "🖼️"
-        elif display_name.endswith(".json"): icon = "｛｝"
-        elif display_name.endswith(".plist"): icon = "⚙️"
-        elif display_name.endswith(".xcassets"): icon = "🎨" # Treat as a file-like bundle
-        elif display_name.endswith((".storyboard", ".xib")): icon = "📱"
-        elif display_name.endswith(".intentdefinition"): icon = "💡"
-        elif display_name.endswith(".strings") or display_name.endswith(".stringsdict"): icon = "🌍"
-        elif display_name.endswith(".entitlements"): icon = "🔑"
-        elif display_name.endswith(".pdf"): icon = "📰"
-        elif display_name.endswith(".playground"): icon = "🎈"
-        # Add more icons as needed
-        print(f"{indent_prefix}{icon} {display_name}")
-
-    elif current_item.isa == 'PBXVariantGroup': # For localized files (e.g., Localizable.strings folder)
+            #      # Fallback logic for when path resolution itself fails for a synced group.
+            #      # print_target_files_from_buildphase relies on PBXSourcesBuildPhase.files, which we know is problematic,
+            #      # so just print the product instead.
+            #      _emit_product_for_group(project, display_name, indent_level + 1, label="Product (path error)")
+
+
+    elif isa == 'PBXFileReference':
+        icon = get_file_icon(display_name)
+        OUTPUT_LINES.append(f"{indent_prefix}{icon} {display_name}")
+
+    elif isa == 'PBXVariantGroup': # For localized files (e.g., Localizable.strings folder)
         icon = "🌍"
-        print(f"{indent_prefix}{icon} {display_name} (Localized Group)")
-        if hasattr(current_item, 'children') and current_item.children:
-            for child_id in current_item.children:
-                child_obj = project.get_object(child_id)
+        OUTPUT_LINES.append(f"{indent_prefix}{icon} {display_name} (Localized Group)")
+        if children:
+            for child_id in children:
+                child_obj = OBJECTS_BY_ID.get(child_id)
                 if child_obj: # These children are usually PBXFileReference for each language
                     _print_recursive(project, child_obj, indent_level + 1, current_project_root_dir)
     
-    elif current_item.isa == 'PBXNativeTarget': # If a target object itself appears directly in the tree
-        target_name = get_display_name(current_item)
-        print(f"{indent_prefix}🎯 {target_name} (Target - direct tree entry)")
+    elif isa == 'PBXNativeTarget': # If a target object itself appears directly in the tree
+        OUTPUT_LINES.append(f"{indent_prefix}🎯 {display_name} (Target - direct tree entry)")
         # Attempt to list its source files from build phase (might be empty as we've seen)
         # and then its product if no source files.
         print_target_files_from_buildphase(project, current_item, indent_level + 1) 
     
     else: # Fallback for any other ISA types not specifically handled
         # This helps identify if there are other object types appearing in the tree
-        print(f"{indent_prefix}{icon} {display_name} (Type: {current_item.isa})")
+        OUTPUT_LINES.append(f"{indent_prefix}{icon} {display_name} (Type: {isa})")
 
 if __name__ == "__main__":
     # --- Optional: Python Environment Debugging (Keep commented unless needed) ---
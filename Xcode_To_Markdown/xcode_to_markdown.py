@@ -11,6 +11,9 @@ import argparse
 import mimetypes
 import datetime
 import unicodedata
+import collections
+import operator
+import concurrent.futures
 
 # ─── DEFAULT CONFIGURATIONS ───────────────────────────────────────────────────
 DEFAULT_IGNORE_DIRS  = {'.git','Pods','build','.swiftpm','DerivedData','.xcodeproj',
@@ -22,32 +25,66 @@ DEFAULT_CODE_EXT     = {'.swift','.h','.m','.mm','.c','.cpp','.hpp','Podfile','C
 DEFAULT_DATA_EXT     = {'.plist','.json','.xml','.yaml','.yml','.storyboard',
                         '.xib','.entitlements','.xcscheme','.md','.txt','.rtf'}
 
+# Extensions that are never text, so is_text_file() can skip the mimetypes guess (lowercased, no dot)
+BINARY_EXT           = frozenset({'png','jpg','jpeg','gif','heic','tiff','pdf','ipa','zip','gz','a','o',
+                                  'dylib','so','car','ttf','otf','mp3','mp4','mov','wav','caf','m4a',
+                                  'psd','sketch','bin','mlmodel','sqlite','db','jar','class'})
+
 DEFAULT_MAX_CODE_LEN = 200000 
 DEFAULT_MAX_DATA_LEN = 15000
 DEFAULT_MAX_PBXPROJ_LEN = -1 
+TEXT_CACHE_CHARS = 8_000_000 # File content kept from the summary pass for reuse in the contents pass
 
 # ─── SANITIZE (strip accents and ■) ───────────────────────────────────────────
+_BOX_TABLE = str.maketrans({'■': '_'})
+
 def sanitize(text: str) -> str:
     """Converts text to basic ASCII, replacing ■ with _."""
-    text = text.replace('■', '_')
+    # Checked before translate(): ■ is not ASCII, so ASCII input (nearly every file name and most
+    # source files) is returned as-is without translate() building a copy
+    if text.isascii():
+        return text
+    text = text.translate(_BOX_TABLE)
+    if text.isascii(): # ■ was the only non-ASCII character: nothing to normalize or strip
+        return text
     nfd_form = unicodedata.normalize('NFD', text)
     return nfd_form.encode('ASCII', 'ignore').decode('ASCII')
 
 # ─── HELPERS ────────────────────────────────────────────────────────────────
-def classify_file(path, code_ext_set, data_ext_set):
-    """Classifies a file as 'code', 'data', or 'other' based on its extension."""
-    _, ext = os.path.splitext(path)
-    if ext.lower() in code_ext_set:
-        return 'code'
-    if ext.lower() in data_ext_set:
-        return 'data'
-    return 'other'
-
-def is_text_file(path, code_ext_set, data_ext_set):
+def build_ext_classes(code_ext_set, data_ext_set):
+    """
+    Builds the 'code'/'data' lookups once per run; returns (ext_classes, name_classes).
+    Entries with a leading dot are extensions (keyed without the dot); dot-less entries such as 'Podfile'
+    are whole file names, matched only for files without an extension. All keys are lowercased.
+    """
+    ext_classes, name_classes = {}, {}
+    for file_class, entries in (('data', data_ext_set), ('code', code_ext_set)): # Code wins if an entry is in both sets
+        for e in entries:
+            if e.startswith('.'):
+                ext_classes[e[1:].lower()] = file_class
+            else:
+                name_classes[e.lower()] = file_class
+    for ext in BINARY_EXT:
+        ext_classes.setdefault(ext, 'binary') # User-configured code/data extensions take precedence
+    return ext_classes, name_classes
+
+def file_ext(filename):
+    """Returns the lowercased extension without the dot, or '' if the name has none."""
+    _, sep, ext = filename.rpartition('.')
+    return ext.lower() if sep else ''
+
+def classify_file(filename, ext, ext_classes, name_classes):
+    """Classifies a file as 'code', 'data', 'binary', or 'other' based on its extension (or name, if it has none)."""
+    if ext:
+        return ext_classes.get(ext, 'other')
+    return name_classes.get(filename.lower(), 'other')
+
+def is_text_file(path, file_class):
     """Determines if a file is likely a text file."""
-    file_type_by_ext = classify_file(path, code_ext_set, data_ext_set)
-    if file_type_by_ext in ('code', 'data'):
+    if file_class in ('code', 'data'):
         return True
+    if file_class == 'binary':
+        return False
     
     try:
         mt, _ = mimetypes.guess_type(path)
@@ -60,48 +97,105 @@ def is_text_file(path, code_ext_set, data_ext_set):
         pass
     return False
 
-def get_directory_tree_md(root_path_param, current_ignore_dirs, current_ignore_files):
-    """Generates a Markdown formatted string of the directory tree."""
+def _scan_dir(dirpath, current_ignore_dirs, depth=0):
+    """
+    Recursively yields (dirpath, depth, filenames) top-down with subdirectories in sorted order, like os.walk.
+    os.scandir's DirEntry already knows each entry's type, so no extra stat() is needed per child.
+    Symlinked directories are neither descended into nor reported as files (os.walk's default).
+    depth counts levels below the starting directory and is carried down, so no path needs re-parsing.
+    """
+    try:
+        with os.scandir(dirpath) as it:
+            entries = list(it)
+    except OSError:
+        return # Unreadable directory; os.walk silently skipped these too
+
+    subdirs = []
+    filenames = []
+    is_ignored_dir = current_ignore_dirs.__contains__ # Bound once; called for every subdirectory
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            filenames.append(name)
+        elif name[:1] != '.' and not is_ignored_dir(name) and not entry.is_symlink():
+            subdirs.append(entry)
+
+    yield dirpath, depth, filenames
+    for entry in sorted(subdirs, key=lambda e: e.name):
+        yield from _scan_dir(entry.path, current_ignore_dirs, depth + 1)
+
+def walk_project(abs_root, current_ignore_dirs, current_ignore_files):
+    """
+    Walks the project tree once, top-down with directories and files sorted, skipping ignored and hidden entries.
+    Returns one (dirpath, level, filenames, header_flags) record per directory: level is 0 for the root,
+    filenames are the files to report on, and header_flags is (has_objc, has_cpp) over the unfiltered listing
+    (used for .h language hints).
+    """
+    records = []
+    for dirpath, level, filenames in _scan_dir(abs_root, current_ignore_dirs):
+        visible_filenames = [fn for fn in sorted(filenames)
+                             if fn[:1] != '.' and fn not in current_ignore_files]
+        # One sweep per directory; the listing itself is not kept
+        has_objc = has_cpp = False
+        for fn in filenames:
+            if fn.endswith(('.m', '.mm')):
+                has_objc = True
+            elif fn.endswith(('.cpp', '.cxx', '.cc')):
+                has_cpp = True
+        records.append((dirpath, level, visible_filenames, (has_objc, has_cpp)))
+    return records
+
+def get_directory_tree_md(project_name, dir_records):
+    """Generates a Markdown formatted string of the directory tree from walk_project() records."""
     lines = []
-    abs_root = os.path.abspath(root_path_param)
-    project_name = sanitize(os.path.basename(abs_root))
-    # print("Generating directory tree...") # Optional: for verbose output
-
-    for dirpath, dirnames, filenames in os.walk(abs_root, topdown=True):
-        dirnames[:] = [d for d in dirnames if d not in current_ignore_dirs and not d.startswith('.')]
-        dirnames.sort()
-        filenames.sort()
-
-        relative_path_to_current_dir = os.path.relpath(dirpath, abs_root)
-        
-        level = 0
-        if relative_path_to_current_dir == ".":
-            lines.append(f"* **{project_name}/**")
+    _append, _sanitize, _basename = lines.append, sanitize, os.path.basename # Local names for the per-entry loop
+    for dirpath, level, filenames, _ in dir_records:
+        if level == 0:
+            _append(f"* **{project_name}/**")
         else:
-            level = relative_path_to_current_dir.count(os.sep) + 1
-            dir_indent = '  ' * (level - 1) if level > 0 else ''
-            lines.append(f"{dir_indent}  * **{sanitize(os.path.basename(dirpath))}/**")
+            dir_indent = '  ' * (level - 1)
+            _append(f"{dir_indent}  * **{_sanitize(_basename(dirpath))}/**")
         
         file_indent = '  ' * level
         for fn in filenames:
-            if fn in current_ignore_files or fn.startswith('.'):
-                continue
-            lines.append(f"{file_indent}  * {sanitize(fn)}")
+            _append(f"{file_indent}  * {_sanitize(fn)}")
             
     return "\n".join(lines)
 
-def get_file_content_and_status(path, max_code, max_data, max_pbxproj, 
-                                current_code_exts, current_data_exts):
-    """Reads, sanitizes, and potentially truncates file content."""
-    info = {'status':'Unknown','extracted_chars':None,'total_chars':None,'error_message':None}
+def _decode_sanitized(raw):
+    """Decodes UTF-8 bytes (dropping invalid sequences), sanitizes them, and normalizes newlines as text mode would."""
+    if raw.isascii(): # One C-level scan of the bytes; ASCII text has nothing for sanitize() to replace or strip
+        text = raw.decode('ascii')
+    else:
+        text = sanitize(raw.decode('utf-8', 'ignore'))
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+# Per-file result: status is 'Full', 'Partial', 'Non-Text', or 'Error'; total_bytes is set instead of
+# total_chars when only a prefix of the file was read.
+FileStatus = collections.namedtuple(
+    'FileStatus', 'relative_path status extracted_chars total_chars total_bytes error_message',
+    defaults=(None, None, None, None))
+
+NON_TEXT_NOTE = "[Non-text file; content not displayed]"
+
+def get_file_content_and_status(path, relative_path, file_class, max_code, max_data, max_pbxproj):
+    """
+    Reads, sanitizes, and potentially truncates file content.
+    Returns (content_parts, status): content_parts is a list of lines/fragments to be joined with newlines,
+    status is a FileStatus.
+    """
     name = os.path.basename(path)
     try:
-        if not is_text_file(path, current_code_exts, current_data_exts):
-            info['status']='Non-Text'
-            return "[Non-text file; content not displayed]", info
+        if not is_text_file(path, file_class):
+            return [NON_TEXT_NOTE], FileStatus(relative_path, 'Non-Text')
         
         limit = -1 
-        file_class = classify_file(path, current_code_exts, current_data_exts)
 
         if name == 'project.pbxproj':
             limit = max_pbxproj
@@ -110,23 +204,35 @@ def get_file_content_and_status(path, max_code, max_data, max_pbxproj,
         elif file_class == 'data':
             limit = max_data
         
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            txt = f.read().replace('\t',' '*4)
+        if limit != -1:
+            # UTF-8 needs at most 4 bytes per character; the slack covers a character split at the boundary
+            prefix_bytes = limit * 4 + 64
+            file_size = os.path.getsize(path)
+            if file_size > prefix_bytes:
+                # Read and decode only the prefix that can survive truncation; the tail is never touched
+                with open(path, 'rb') as f:
+                    prefix = _decode_sanitized(f.read(prefix_bytes))
+                if len(prefix) > limit:
+                    snippet = prefix[:limit]
+                    # Only the prefix was decoded, so the total size is reported in bytes
+                    return ([snippet, "", f"[Truncated at {len(snippet)} chars of {file_size} bytes]"],
+                            FileStatus(relative_path, 'Partial', extracted_chars=len(snippet), total_bytes=file_size))
+                # Sanitizing stripped too much of the prefix (e.g. emoji-heavy text); fall back to a full read
+
+        # Tabs pass through unchanged: fenced code blocks preserve them, so there is no need to rewrite the text
+        with open(path, 'rb') as f:
+            txt = _decode_sanitized(f.read())
         
-        txt = sanitize(txt)
         total = len(txt)
-        info['total_chars'] = total
 
         if limit != -1 and total > limit:
             snippet = txt[:limit]
-            info.update(status='Partial', extracted_chars=len(snippet))
-            return snippet + f"\n\n[Truncated at {info['extracted_chars']} of {total} chars]", info
+            return ([snippet, "", f"[Truncated at {len(snippet)} of {total} chars]"],
+                    FileStatus(relative_path, 'Partial', extracted_chars=len(snippet), total_chars=total))
         
-        info.update(status='Full', extracted_chars=total)
-        return txt, info
+        return [txt], FileStatus(relative_path, 'Full', extracted_chars=total, total_chars=total)
     except Exception as e:
-        info.update(status='Error', error_message=str(e))
-        return f"[Error reading {name}: {e}]", info
+        return [f"[Error reading {name}: {e}]"], FileStatus(relative_path, 'Error', error_message=str(e))
 
 def generate_summary_table_md(data, summary_counts):
     """Generates a Markdown formatted summary table."""
@@ -143,26 +249,31 @@ def generate_summary_table_md(data, summary_counts):
     lines.append("| " + " | ".join(header) + " |")
     lines.append("|" + " :--- |".join([""]*(len(header)+1))) 
 
-    for item in sorted(data, key=lambda x: x['relative_path']):
-        rp = sanitize(item['relative_path'])
-        st = item['status']
+    for item in sorted(data, key=operator.attrgetter('relative_path')):
+        rp = sanitize(item.relative_path)
+        st = item.status
         
         disp_status = ''
         details = ''
         
         if st == 'Full':
             disp_status = 'Full'
-            details = f"{item['total_chars']} chars"
+            details = f"{item.total_chars} chars"
         elif st == 'Partial':
-            pct = int((item['extracted_chars'] / item['total_chars']) * 100) if item['total_chars'] and item['total_chars'] > 0 else 0
-            disp_status = f'Partial ({pct}%)'
-            details = f"{item['extracted_chars']} / {item['total_chars']} chars"
+            if item.total_chars is not None:
+                total = item.total_chars
+                details = f"{item.extracted_chars} / {total} chars"
+                pct = int((item.extracted_chars / total) * 100) if total and total > 0 else 0
+                disp_status = f'Partial ({pct}%)'
+            else: # Only a prefix of the file was read, so its size is known in bytes
+                details = f"{item.extracted_chars} chars / {item.total_bytes} bytes"
+                disp_status = 'Partial' # Characters over bytes is not a meaningful percentage
         elif st == 'Non-Text':
             disp_status = 'Non-Text'
             details = 'N/A'
         else: # Error
             disp_status = 'Error'
-            details = item.get('error_message', '')[:80] # Truncate long error messages
+            details = (item.error_message or '')[:80] # Truncate long error messages
 
         rp_md = rp.replace("|", "\\|") # Escape pipe characters for Markdown table
         details_md = str(details).replace("|", "\\|")
@@ -170,37 +281,37 @@ def generate_summary_table_md(data, summary_counts):
         lines.append(f"| `{rp_md}` | {disp_status} | {details_md} |")
     return "\n".join(lines)
 
-def get_lang_hint(file_path, files_in_same_dir):
-    """Determines a language hint for Markdown code blocks."""
-    _, ext = os.path.splitext(file_path)
-    lang_hint = ext[1:].lower() # Remove dot and lowercase
-
-    if lang_hint in ["storyboard", "xib", "xcscheme", "entitlements", "plist"]:
-        return "xml"
-    if lang_hint == "mm":
-        return "objective-c"
-    if lang_hint == "podfile":
-        return "ruby"
-    if lang_hint == "cartfile" or lang_hint == "yml" or lang_hint == "yaml":
-        return "yaml"
-    if lang_hint == "h": # Try to guess C, C++, or Objective-C for .h files
-        is_objc_header = any(f.endswith(('.m', '.mm')) for f in files_in_same_dir)
-        if is_objc_header: return "objective-c"
-        is_cpp_header = any(f.endswith(('.cpp', '.cxx', '.cc')) for f in files_in_same_dir)
-        if is_cpp_header: return "cpp"
+# Extension (lowercased, no dot) -> Markdown language hint.
+# '.h' is not listed: it depends on the other files in its directory (see get_lang_hint).
+_EXT_TO_LANG = {
+    'storyboard': 'xml', 'xib': 'xml', 'xcscheme': 'xml', 'entitlements': 'xml', 'plist': 'xml',
+    'mm': 'objective-c',
+    'yml': 'yaml', 'yaml': 'yaml',
+    'hpp': 'cpp',
+    'pbxproj': 'text', # It's a property list; 'text' is safest. 'json' might be too specific.
+}
+# Common languages that map directly
+_EXT_TO_LANG.update((lang, lang) for lang in (
+    "swift", "m", "c", "cpp", "json", "sh", "py", "rb", "js", "ts",
+    "java", "kt", "go", "rs", "html", "css", "scss", "less", "php",
+    "md", "txt"))
+
+# Whole (lowercased) file name -> hint, for files without an extension
+_NAME_TO_LANG = {'podfile': 'ruby', 'cartfile': 'yaml'}
+
+def get_lang_hint(filename, ext, dir_flags):
+    """
+    Determines a language hint for Markdown code blocks.
+    dir_flags is (has_objc, has_cpp) for the file's directory, computed once per directory.
+    """
+    if not ext:
+        return _NAME_TO_LANG.get(filename.lower(), "")
+    if ext == "h": # Try to guess C, C++, or Objective-C for .h files
+        has_objc, has_cpp = dir_flags
+        if has_objc: return "objective-c"
+        if has_cpp: return "cpp"
         return "c" # Default to C for .h if no stronger indicator
-    if lang_hint == "hpp":
-        return "cpp"
-    if lang_hint == "pbxproj": # project.pbxproj
-        return "text" # It's a property list; 'text' is safest. 'json' might be too specific.
-    
-    # Common languages that map directly
-    if lang_hint in ["swift", "m", "c", "cpp", "json", "sh", "py", "rb", "js", "ts", 
-                     "java", "kt", "go", "rs", "html", "css", "scss", "less", "php", 
-                     "md", "txt"]:
-        return lang_hint
-        
-    return "" # No hint if unknown
+    return _EXT_TO_LANG.get(ext, "") # No hint if unknown
 
 def generate_md_report(root_dir, output_md_path, 
                        max_code_len_cfg, max_data_len_cfg, max_pbxproj_len_cfg,
@@ -220,102 +331,128 @@ def generate_md_report(root_dir, output_md_path,
     md_content_parts.append(f"\n*Generated: {generation_timestamp}*")
     md_content_parts.append(f"*Source: `{abs_root_dir}`*\n")
 
-    # --- Directory Tree ---
+    # --- Single walk: the tree, summary, and contents are all rendered from these records ---
     print("Generating directory tree...")
-    md_content_parts.append(get_directory_tree_md(abs_root_dir, ignore_dirs_set_cfg, ignore_files_set_cfg))
+    dir_records = walk_project(abs_root_dir, ignore_dirs_set_cfg, ignore_files_set_cfg)
+    md_content_parts.append(get_directory_tree_md(project_name_sanitized, dir_records))
     md_content_parts.append("\n---\n") # Horizontal rule
 
+    ext_classes, name_classes = build_ext_classes(code_ext_set_cfg, data_ext_set_cfg)
+    files_index = [] # (dirpath, filename, full_path, relative_path, ext, file_class)
+    header_flags_by_dir = {} # dirpath -> (has_objc, has_cpp), for .h language hints
+    _join, _relpath, _file_ext, _classify = os.path.join, os.path.relpath, file_ext, classify_file # Local names for the per-file loop
+    _index_append = files_index.append
+    for dirpath, _, filenames, header_flags in dir_records:
+        header_flags_by_dir[dirpath] = header_flags
+        for filename in filenames:
+            full_path = _join(dirpath, filename)
+            ext = _file_ext(filename) # Computed once per file and carried in the record
+            _index_append((dirpath, filename, full_path, _relpath(full_path, abs_root_dir),
+                           ext, _classify(filename, ext, ext_classes, name_classes)))
+
     # --- Summary Table ---
+    # File content read here is kept for the contents pass only while it fits in TEXT_CACHE_CHARS;
+    # anything beyond that budget is re-read while the report is written, so memory stays bounded.
     file_summary_data = []
-    all_files_in_project_structure = {} # To store siblings for lang_hint
     summary_stats = {
         'total_processed': 0, 'code_files': 0, 'data_files': 0,
         'other_text_files': 0, 'non_text_files': 0, 'error_files': 0
     }
     
     print("Analyzing files for summary...")
-    for dirpath, dirnames, filenames_in_current_dir in os.walk(abs_root_dir, topdown=True):
-        dirnames[:] = [d for d in dirnames if d not in ignore_dirs_set_cfg and not d.startswith('.')]
-        all_files_in_project_structure[dirpath] = filenames_in_current_dir # Store siblings
-
-        for filename in sorted(filenames_in_current_dir):
-            if filename in ignore_files_set_cfg or filename.startswith('.'):
-                continue
-            
-            summary_stats['total_processed'] += 1
-            full_path = os.path.join(dirpath, filename)
-            file_class = classify_file(full_path, code_ext_set_cfg, data_ext_set_cfg)
-            
-            _, status_info = get_file_content_and_status(
-                full_path, max_code_len_cfg, max_data_len_cfg, max_pbxproj_len_cfg,
-                code_ext_set_cfg, data_ext_set_cfg
-            )
-            status_info['relative_path'] = os.path.relpath(full_path, abs_root_dir)
-            file_summary_data.append(status_info)
-
-            # Update summary counts based on status and classification
-            if status_info['status'] == 'Error':
-                summary_stats['error_files'] += 1
-            elif status_info['status'] == 'Non-Text':
-                summary_stats['non_text_files'] += 1
-            else: # It's some kind of text file
-                if file_class == 'code':
-                    summary_stats['code_files'] += 1
-                elif file_class == 'data':
-                    summary_stats['data_files'] += 1
-                else: # Text file, but not classified as code/data by extension (e.g. .txt without specific rule)
-                     summary_stats['other_text_files'] += 1
+    def read_one(file_record):
+        return get_file_content_and_status(
+            file_record[2], file_record[3], file_record[5], max_code_len_cfg, max_data_len_cfg, max_pbxproj_len_cfg
+        )
+
+    # Files are independent, so reads overlap in a thread pool (the GIL is released during I/O);
+    # executor.map returns results in files_index order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        statuses = []
+        content_cache = {} # full_path -> content_parts; each entry is popped when its section is written
+        cache_budget = TEXT_CACHE_CHARS
+        for file_record, (content_parts, status_info) in zip(files_index, executor.map(read_one, files_index)):
+            statuses.append(status_info)
+            if status_info.status != 'Non-Text':
+                size = sum(map(len, content_parts))
+                if size <= cache_budget:
+                    content_cache[file_record[2]] = content_parts
+                    cache_budget -= size
+
+    for (dirpath, filename, full_path, relative_path, ext, file_class), status_info in zip(files_index, statuses):
+        summary_stats['total_processed'] += 1
+        file_summary_data.append(status_info)
+
+        # Update summary counts based on status and classification
+        if status_info.status == 'Error':
+            summary_stats['error_files'] += 1
+        elif status_info.status == 'Non-Text':
+            summary_stats['non_text_files'] += 1
+        else: # It's some kind of text file
+            if file_class == 'code':
+                summary_stats['code_files'] += 1
+            elif file_class == 'data':
+                summary_stats['data_files'] += 1
+            else: # Text file, but not classified as code/data by extension (e.g. .txt without specific rule)
+                 summary_stats['other_text_files'] += 1
                      
     md_content_parts.append(generate_summary_table_md(file_summary_data, summary_stats))
     md_content_parts.append("\n---\n") # Horizontal rule
 
-    # --- File Contents ---
-    md_content_parts.append("## File Contents\n")
-    print("Extracting and formatting file contents...")
-    
-    processed_files_for_content = 0
-    for dirpath, dirnames, filenames_in_current_dir in os.walk(abs_root_dir, topdown=True):
-        dirnames[:] = [d for d in dirnames if d not in ignore_dirs_set_cfg and not d.startswith('.')]
-        filenames_in_current_dir.sort() # Ensure consistent order
-
-        for filename in filenames_in_current_dir:
-            if filename in ignore_files_set_cfg or filename.startswith('.'):
-                continue
-            
-            processed_files_for_content += 1
-            if processed_files_for_content % 20 == 0: # Progress update less frequently
-                print(f"  Formatted content for {processed_files_for_content} files...")
-
-            full_path = os.path.join(dirpath, filename)
-            relative_path_sanitized = sanitize(os.path.relpath(full_path, abs_root_dir))
-            
-            content_text, status_info = get_file_content_and_status(
-                full_path, max_code_len_cfg, max_data_len_cfg, max_pbxproj_len_cfg,
-                code_ext_set_cfg, data_ext_set_cfg
-            )
-            
-            md_content_parts.append(f"### File: `{relative_path_sanitized}`\n")
-
-            if status_info['status'] == 'Non-Text' or status_info['status'] == 'Error':
-                md_content_parts.append(f"```text\n{content_text}\n```\n")
-            else: # Full or Partial text content
-                parent_dir_of_file = os.path.dirname(full_path)
-                sibling_files = all_files_in_project_structure.get(parent_dir_of_file, [])
-                language_hint = get_lang_hint(filename, sibling_files)
-                
-                md_content_parts.append(f"```{language_hint}") # Start code block with lang hint
-                md_content_parts.append(content_text)
-                md_content_parts.append("```\n")
-
     # --- Write to file ---
+    # The report is streamed: the parts collected so far (metadata, tree, summary) are written first,
+    # then each file's section is written and dropped before the next file is read.
     try:
         # Ensure output directory exists
         output_md_dir = os.path.dirname(output_md_path)
         if output_md_dir and not os.path.exists(output_md_dir): # Check if output_md_dir is not empty (i.e. not current dir)
             os.makedirs(output_md_dir)
             
-        with open(output_md_path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(md_content_parts))
+        # A 1 MiB buffer turns the many small fragments into large writes
+        with open(output_md_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            def flush_parts():
+                # Fragments go straight into the buffer; joining them (or appending '\n' to each)
+                # would copy every file's text once more before writing it
+                for part in md_content_parts:
+                    write(part)
+                    write("\n")
+                md_content_parts.clear()
+
+            # --- File Contents ---
+            md_content_parts.append("## File Contents\n")
+            flush_parts()
+            print("Extracting and formatting file contents...")
+            
+            processed_files_for_content = 0
+            _append, _sanitize = md_content_parts.append, sanitize # Local names for the per-file loop
+            for file_record, summary_status in zip(files_index, statuses):
+                dirpath, filename, full_path, relative_path, ext, file_class = file_record
+                processed_files_for_content += 1
+                if processed_files_for_content % 20 == 0: # Progress update less frequently
+                    print(f"  Formatted content for {processed_files_for_content} files...")
+
+                relative_path_sanitized = _sanitize(relative_path)
+                cached_parts = content_cache.pop(full_path, None)
+                if summary_status.status == 'Non-Text':
+                    # Already known from the summary pass, and there is no content to show
+                    content_parts, status_info = [NON_TEXT_NOTE], summary_status
+                elif cached_parts is not None:
+                    content_parts, status_info = cached_parts, summary_status
+                else:
+                    content_parts, status_info = read_one(file_record)
+                
+                # Every fragment is its own list entry; flush_parts() adds the newlines
+                _append(f"### File: `{relative_path_sanitized}`")
+                _append("")
+
+                if status_info.status in ('Non-Text', 'Error'):
+                    _append("```text")
+                else: # Full or Partial text content
+                    _append("```" + get_lang_hint(filename, ext, header_flags_by_dir[dirpath])) # Start code block with lang hint
+                md_content_parts.extend(content_parts)
+                _append("```\n")
+                flush_parts()
         print(f"✅ Markdown report generated successfully: {output_md_path}")
     except IOError as e:
         print(f"Error writing Markdown report to file {output_md_path}: {e}")